@@ -2,26 +2,35 @@ from __future__ import annotations
 
 import argparse
 import getpass
-import inspect
+import io
 import json
 import logging
 import os
 import random
+import re
 import secrets
 import shutil
+import signal
 import socket
 import subprocess
 import sys
+import threading
 import time
 import zipfile
+from concurrent.futures import ALL_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from contextlib import suppress
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from functools import cached_property, partial
 from pathlib import Path
-from typing import Dict, Literal, List, NoReturn, Union, Tuple
+from typing import Dict, Literal, List, NoReturn, Set, Union, Tuple
 from urllib import request
-from urllib.request import urlretrieve
 from uuid import uuid4
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logging.basicConfig(
     level=logging.INFO, stream=sys.stdout, format="%(asctime)s - %(levelname)s - %(message)s"
 )
@@ -35,7 +44,9 @@ if getpass.getuser() != "root":
 
 URL = "https://github.com/juicity/juicity/releases/download/v0.1.0/juicity-linux-x86_64.zip"
 
-TEMPLATE_SERVICE = """
+
+def _render_service(exec_start: str, working_directory: str) -> str:
+    return f"""
 [Unit]
 Description=juicity-server Service
 Documentation=https://github.com/juicity/juicity
@@ -55,6 +66,31 @@ WantedBy=multi-user.target
 """
 
 
+def _json_dumps(obj) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf8")
+    return json.dumps(obj, indent=2, ensure_ascii=True)
+
+
+def _json_loads(sp: Path):
+    if orjson is not None:
+        return orjson.loads(sp.read_bytes())
+    return json.loads(sp.read_text(encoding="utf8"))
+
+
+def _run(cmd: List[str], check: bool = False) -> int:
+    """Execute the command without a shell wrapper and discard its output"""
+    try:
+        result = subprocess.run(
+            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=check
+        )
+    except FileNotFoundError:
+        if check:
+            raise
+        return 127
+    return result.returncode
+
+
 @dataclass
 class Project:
     workstation = Path("/home/juicity")
@@ -78,16 +114,43 @@ class Project:
     def __post_init__(self):
         os.makedirs(self.workstation, exist_ok=True)
 
+    @staticmethod
+    def bound_udp_ports() -> Set[int]:
+        """Sockets sharing the port via SO_REUSEADDR/SO_REUSEPORT still show up in /proc"""
+        ports = set()
+        for table in ("/proc/net/udp", "/proc/net/udp6"):
+            with suppress(OSError), open(table, encoding="utf8") as file:
+                next(file, None)
+                for line in file:
+                    ports.add(int(line.split()[1].rsplit(":", 1)[1], 16))
+        return ports
+
     @staticmethod
     def is_port_in_used(_port: int, proto: Literal["tcp", "udp"]) -> bool | None:
         """Check socket UDP/data_gram or TCP/data_stream"""
         proto2type = {"tcp": socket.SOCK_STREAM, "udp": socket.SOCK_DGRAM}
-        socket_type = proto2type[proto]
+        # O_NONBLOCK is set atomically by socket(2), the probe never blocks anyway
+        socket_type = proto2type[proto] | getattr(socket, "SOCK_NONBLOCK", 0)
         with suppress(socket.error), socket.socket(socket.AF_INET, socket_type) as s:
-            s.bind(("127.0.0.1", _port))
+            # Ports lingering in TIME_WAIT are still usable by the server
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            s.bind(("0.0.0.0", _port))
             return False
         return True
 
+    def _probe_udp_ports(self, ports: List[int]) -> int | None:
+        """Probe a batch of candidate ports concurrently, return the first free one"""
+        bound = self.bound_udp_ports()
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            futures = {
+                executor.submit(self.is_port_in_used, p, proto="udp"): p
+                for p in ports
+                if p not in bound
+            }
+            for future in as_completed(futures):
+                if not future.result():
+                    return futures[future]
+
     @property
     def server_ip(self):
         return self._server_ip
@@ -100,13 +163,23 @@ class Project:
     def server_port(self):
         # 初始化监听端口
         if self._server_port < 0:
-            rand_ports = list(range(41670, 46990))
-            random.shuffle(rand_ports)
-            for p in rand_ports:
-                if not self.is_port_in_used(p, proto="udp"):
+            port_range = range(41670, 46990)
+            batch, remaining = random.sample(port_range, 64), None
+            while batch:
+                p = self._probe_udp_ports(batch)
+                if p is not None:
                     self._server_port = p
                     logging.info(f"正在初始化监听端口 - port={p}")
                     break
+                # 首批采样全部被占用时，打乱剩余端口并继续分批探测
+                if remaining is None:
+                    tried = set(batch)
+                    remaining = [p for p in port_range if p not in tried]
+                    random.shuffle(remaining)
+                batch, remaining = remaining[:64], remaining[64:]
+            else:
+                logging.error(f"没有可用的 UDP 端口 - scope=[{port_range[0]}, {port_range[-1]}]")
+                sys.exit()
 
         # 返回已绑定的空闲端口
         return self._server_port
@@ -119,13 +192,16 @@ class Project:
     def alias(self):
         return f"alias {self._alias}='{self._remote_command}'"
 
+    @cached_property
+    def alias_pattern(self) -> re.Pattern:
+        return re.compile(r"\n?" + re.escape(self.alias) + r"\n?")
+
     def set_alias(self):
         # Avoid adding `juicy` alias repeatedly
         if self.path_bash_aliases.exists():
             pre_text = self.path_bash_aliases.read_text(encoding="utf8")
-            for ck in [f"\n{self.alias}\n", f"\n{self.alias}", f"{self.alias}\n", self.alias]:
-                if ck in pre_text:
-                    return
+            if self.alias_pattern.search(pre_text):
+                return
         # New `juicy` alias record
         with open(self.path_bash_aliases, "a", encoding="utf8") as file:
             file.write(f"\n{self.alias}\n")
@@ -137,8 +213,7 @@ class Project:
             if not hp.exists():
                 continue
             text = hp.read_text(encoding="utf8")
-            for ck in [f"\n{self.alias}\n", f"\n{self.alias}", f"{self.alias}\n", self.alias]:
-                text = text.replace(ck, "")
+            text = self.alias_pattern.sub("", text)
             hp.write_text(text, encoding="utf8")
 
     @staticmethod
@@ -148,7 +223,7 @@ class Project:
 
     @property
     def systemd_template(self) -> str:
-        return TEMPLATE_SERVICE.format(
+        return _render_service(
             exec_start=f"{self.executable} run -c {self.server_config}",
             working_directory=f"{self.workstation}",
         )
@@ -168,45 +243,90 @@ class Certificate:
 
 
 class CertBot:
+    _dependencies_lock = threading.Lock()
+    _dependencies_ready = False
+
     def __init__(self, domain: str):
         self._domain = domain
 
         self._should_revive_port_80 = False
         self._is_success = True
 
+    @classmethod
+    def install_dependencies(cls):
+        """可提前在后台调用，重复调用时等待首次安装完成"""
+        with cls._dependencies_lock:
+            if cls._dependencies_ready:
+                return
+
+            # Repeated runs on the same host skip apt entirely
+            if shutil.which("certbot"):
+                logging.info("certbot 已安装")
+            else:
+                logging.info("正在更新包索引")
+                _run(["apt-get", "update", "-y"])
+
+                logging.info("安装 certbot")
+                _run(["apt-get", "install", "-y", "--no-install-recommends", "certbot"])
+
+            cls._dependencies_ready = True
+
+    @staticmethod
+    def _find_listener_pids(port: int) -> List[int]:
+        """Resolve TCP listeners from /proc/net/tcp{,6} to the PIDs that own the socket"""
+        inodes = set()
+        for table in ("/proc/net/tcp", "/proc/net/tcp6"):
+            with suppress(OSError), open(table, encoding="utf8") as file:
+                next(file, None)
+                for line in file:
+                    cols = line.split()
+                    # local_address is HEX_IP:HEX_PORT, st 0A means LISTEN
+                    if int(cols[1].rsplit(":", 1)[1], 16) == port and cols[3] == "0A":
+                        inodes.add(f"socket:[{cols[9]}]")
+        if not inodes:
+            return []
+
+        pids = []
+        with os.scandir("/proc") as it:
+            for entry in it:
+                if not entry.name.isdigit():
+                    continue
+                with suppress(OSError), os.scandir(f"{entry.path}/fd") as fds:
+                    for fd in fds:
+                        with suppress(OSError):
+                            if os.readlink(fd.path) in inodes:
+                                pids.append(int(entry.name))
+                                break
+        return pids
+
     def _cert_pre_hook(self):
         # Fallback strategy: Ensure smooth flow of certificate requests
         p = Path("/etc/letsencrypt/live/")
-        if p.exists():
+        if p.exists() and not p.joinpath(self._domain).exists():
             logging.info("移除證書殘影...")
-            for k in os.listdir(p):
-                k_full = p.joinpath(k)
-                if (
-                    not p.joinpath(self._domain).exists()
-                    and k.startswith(f"{self._domain}-")
-                    and k_full.is_dir()
-                ):
-                    shutil.rmtree(k_full, ignore_errors=True)
+            prefix = f"{self._domain}-"
+            with os.scandir(p) as it:
+                for entry in it:
+                    if entry.name.startswith(prefix) and entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path, ignore_errors=True)
 
         logging.info("正在为解析到本机的域名申请免费证书")
-
-        logging.info("正在更新包索引")
-        os.system("apt update -y > /dev/null 2>&1 ")
-
-        logging.info("安装 certbot")
-        os.system("apt install certbot -y > /dev/null 2>&1")
+        self.install_dependencies()
 
         # Pre-hook strategy: stop process running in port 80
         logging.info("检查 80 端口占用")
         if Project.is_port_in_used(80, proto="tcp"):
-            os.system("systemctl stop nginx > /dev/null 2>&1 && nginx -s stop > /dev/null 2>&1")
-            os.system("kill $(lsof -t -i:80)  > /dev/null 2>&1")
+            if _run(["systemctl", "stop", "nginx"]) == 0:
+                _run(["nginx", "-s", "stop"])
+            for pid in self._find_listener_pids(80):
+                with suppress(OSError):
+                    os.kill(pid, signal.SIGTERM)
             self._should_revive_port_80 = True
 
     def _cert_post_hook(self):
         # Post-hook strategy: restart process running in port 80
         if self._should_revive_port_80:
-            os.system("systemctl restart nginx > /dev/null 2>&1")
+            _run(["systemctl", "restart", "nginx"])
             self._should_revive_port_80 = False
 
         # Exception: certs 5 per 7 days
@@ -215,7 +335,8 @@ class CertBot:
 
         # This operation ensures that certbot.timer is started
         logging.info(f"运行证书续订服务 - service=certbot.timer")
-        os.system(f"systemctl daemon-reload && systemctl enable --now certbot.timer")
+        _run(["systemctl", "daemon-reload"])
+        _run(["systemctl", "enable", "--now", "certbot.timer"])
 
     def _run(self):
         logging.info("开始申请证书")
@@ -228,15 +349,19 @@ class CertBot:
             "--non-interactive "
             "-d {domain}"
         )
-        p = subprocess.Popen(
-            cmd.format(domain=self._domain).split(),
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            universal_newlines=True,
-            text=True,
-        )
-        output = p.stderr.read().strip()
+        try:
+            result = subprocess.run(
+                cmd.format(domain=self._domain).split(),
+                stdin=subprocess.DEVNULL,
+                capture_output=True,
+                text=True,
+                timeout=120,
+            )
+        except subprocess.TimeoutExpired:
+            logging.error(f"证书申请超时 - domain={self._domain}")
+            self._is_success = False
+            return
+        output = result.stderr.strip()
         if output and "168 hours" in output:
             logging.warning(
                 """
@@ -276,48 +401,79 @@ class Service:
 
     @classmethod
     def build_from_template(cls, path: Path, template: str | None = ""):
-        if template:
+        # daemon-reload re-parses every unit file, only run it when the unit actually changed
+        if template and not (path.exists() and path.read_text(encoding="utf8") == template):
             path.write_text(template, encoding="utf8")
-            os.system("systemctl daemon-reload")
+            _run(["systemctl", "daemon-reload"])
         return cls(path=path)
 
     def download_server(self, workstation: Path):
-        zip_path = workstation.joinpath(URL.split("/")[-1])
         ex_path = workstation.joinpath("juicity-server")
 
+        # The archive is only a few MB, extract it in memory instead of landing it on disk
+        with request.urlopen(URL) as resp:
+            data = resp.read()
+        logging.info(f"下载完毕 - url={URL}")
+
+        with zipfile.ZipFile(io.BytesIO(data)) as zf:
+            member = zf.getinfo(ex_path.name)
+            if ex_path.exists() and ex_path.stat().st_size == member.file_size:
+                logging.info(f"执行文件已存在 - ex_path={ex_path}")
+            else:
+                self._extract_server(zf, member, workstation)
+
+        os.chmod(ex_path, 0o755)
+        logging.info(f"授予执行权限 - ex_path={ex_path}")
+
+    def _extract_server(self, zf: zipfile.ZipFile, member: zipfile.ZipInfo, workstation: Path):
         try:
-            urlretrieve(URL, f"{zip_path}")
-            logging.info(f"下载完毕 - zip_path={zip_path}")
-            with zipfile.ZipFile(zip_path) as zf:
-                zf.extractall(workstation)
+            zf.extract(member, workstation)
         except OSError:
             logging.info("服务正忙，尝试停止任务...")
             self.stop()
             time.sleep(0.5)
-            return self.download_server(workstation)
-        else:
-            os.system(f"chmod +x {ex_path}")
-            logging.info(f"授予执行权限 - ex_path={ex_path}")
+            return self._extract_server(zf, member, workstation)
 
     def start(self):
         """部署服务之前需要先初始化服务端配置并将其写到工作空间"""
-        os.system(f"systemctl enable --now {self.name}")
+        _run(["systemctl", "enable", "--now", self.name])
         logging.info("系统服务已启动")
         logging.info("已设置服务开机自启")
 
     def stop(self):
         logging.info("停止系统服务")
-        os.system(f"systemctl stop {self.name}")
+        _run(["systemctl", "stop", self.name])
 
     def restart(self):
         logging.info("重启系统服务")
-        os.system(f"systemctl daemon-reload && systemctl restart {self.name}")
+        try:
+            result = subprocess.run(
+                ["systemctl", "show", "-p", "NeedDaemonReload", "--value", self.name],
+                capture_output=True,
+                text=True,
+                timeout=30,
+            )
+            need_reload = result.stdout.strip() != "no"
+        except subprocess.TimeoutExpired:
+            need_reload = True
+        if need_reload:
+            _run(["systemctl", "daemon-reload"])
+        _run(["systemctl", "restart", self.name])
+
+    @staticmethod
+    def active_states(*units: str) -> List[str]:
+        """Query several units with one `systemctl is-active` call, one state per unit"""
+        try:
+            result = subprocess.run(
+                ["systemctl", "is-active", *units], capture_output=True, text=True, timeout=30
+            )
+        except subprocess.TimeoutExpired:
+            return ["unknown"] * len(units)
+        states = result.stdout.split()
+        return states + ["unknown"] * (len(units) - len(states))
 
     def status(self) -> Tuple[bool, str]:
-        result = subprocess.run(
-            f"systemctl is-active {self.name}".split(), capture_output=True, text=True
-        )
-        text = result.stdout.strip()
+        (text,) = self.active_states(self.name)
         response = None
         if text == "inactive":
             text = "\033[91m" + text + "\033[0m"
@@ -326,31 +482,42 @@ class Service:
             response = True
         return response, text
 
-    def remove(self, workstation: Path):
+    def remove(self, project: Project):
         logging.info("注销系统服务")
-        os.system(f"systemctl disable --now {self.name} > /dev/null 2>&1")
+        _run(["systemctl", "disable", "--now", self.name])
 
         logging.info("关停相关进程")
-        os.system("pkill juicity-server")
+        _run(["pkill", "juicity-server"])
 
         logging.info("移除系统服务配置文件")
         if self.path.exists():
             os.remove(self.path)
 
         logging.info("移除工作空间")
-        shutil.rmtree(workstation)
+        workstation = project.workstation
+        for p in (
+            project.executable,
+            project.server_config,
+            project.client_nekoray_config,
+            project.sharelink,
+            workstation.joinpath(URL.split("/")[-1]),
+        ):
+            p.unlink(missing_ok=True)
+        try:
+            workstation.rmdir()
+        except FileNotFoundError:
+            pass
+        except OSError:
+            # 旧版本会解压出完整的发行包，此时回退到递归删除
+            shutil.rmtree(workstation, ignore_errors=True)
 
 
 # =================================== Runtime Settings ===================================
 
 
 def from_dict_to_cls(cls, data):
-    return cls(
-        **{
-            key: (data[key] if val.default == val.empty else data.get(key, val.default))
-            for key, val in inspect.signature(cls).parameters.items()
-        }
-    )
+    # Missing keys fall back to the dataclass defaults, unknown keys are dropped
+    return cls(**{f.name: data[f.name] for f in fields(cls) if f.name in data})
 
 
 @dataclass
@@ -360,7 +527,7 @@ class User:
 
     @classmethod
     def gen(cls):
-        return cls(username=str(uuid4()), password=secrets.token_hex()[:16])
+        return cls(username=str(uuid4()), password=secrets.token_hex(8))
 
 
 @dataclass
@@ -397,7 +564,7 @@ class ServerConfig:
         )
 
     def to_json(self, sp: Path):
-        sp.write_text(json.dumps(self.__dict__, indent=4, ensure_ascii=True))
+        sp.write_text(_json_dumps(self.__dict__))
         logging.info(f"保存服务端配置文件 - save_path={sp}")
 
 
@@ -438,29 +605,30 @@ class NekoRayConfig:
 
     @classmethod
     def from_json(cls, sp: Path):
-        data = json.loads(sp.read_text(encoding="utf8"))
+        data = _json_loads(sp)
         return from_dict_to_cls(cls, data)
 
     def to_json(self, sp: Path):
-        sp.write_text(json.dumps(self.__dict__, indent=4, ensure_ascii=True))
+        sp.write_text(self.showcase)
 
     def to_sharelink(self, sp: Path):
         sp.write_text(self.sharelink)
 
-    @property
+    @cached_property
     def showcase(self) -> str:
-        return json.dumps(self.__dict__, indent=4, ensure_ascii=True)
+        # Serialized once per instance, the config is not mutated after construction
+        return _json_dumps({f.name: getattr(self, f.name) for f in fields(self)})
 
     @property
     def sharelink(self) -> str:
-        sl = (
-            f"juicity://{self.uuid}:{self.password}@{self.server}"
-            f"?congestion_control={self.congestion_control}"
-            f"&allow_insecure={int(self.allow_insecure)}"
-        )
+        parts = [
+            f"juicity://{self.uuid}:{self.password}@{self.server}",
+            f"?congestion_control={self.congestion_control}",
+            f"&allow_insecure={int(self.allow_insecure)}",
+        ]
         if self.sni:
-            sl += f"&sni={self.sni}"
-        return sl
+            parts.append(f"&sni={self.sni}")
+        return "".join(parts)
 
     @property
     def serv_peer(self) -> Tuple[str, str]:
@@ -493,6 +661,9 @@ class Template:
         self.project = project
         self.mode = mode
 
+        # 安装流程中直接复用刚生成的配置，避免回读文件
+        self._last_nekoray: NekoRayConfig | None = None
+
     def gen_clients(self, server_addr: str, user: User, server_config: ServerConfig):
         logging.info("正在生成客户端配置文件")
         project = self.project
@@ -507,12 +678,14 @@ class Template:
         )
         nekoray.to_json(project.client_nekoray_config)
         nekoray.to_sharelink(project.sharelink)
+        self._last_nekoray = nekoray
 
     def print_nekoray(self):
-        if not self.project.client_nekoray_config.exists():
+        nekoray = self._last_nekoray
+        if nekoray is None and not self.project.client_nekoray_config.exists():
             logging.error(f"❌ 客户端配置文件不存在 - path={self.project.client_nekoray_config}")
         else:
-            nekoray = NekoRayConfig.from_json(self.project.client_nekoray_config)
+            nekoray = nekoray or NekoRayConfig.from_json(self.project.client_nekoray_config)
             serv_addr, serv_port = nekoray.serv_peer
             print(TEMPLATE_PRINT_SHARELINK.format(sharelink=nekoray.sharelink))
             print(
@@ -536,6 +709,27 @@ class Template:
 
 
 class Scaffold:
+    @staticmethod
+    def _lookup_domain(domain: str) -> Tuple[str, str]:
+        """
+
+        :param domain:
+        :return: Tuple[server_ip, my_ip]
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            resolve = executor.submit(
+                socket.getaddrinfo,
+                domain,
+                None,
+                family=socket.AF_INET,
+                type=socket.SOCK_STREAM,
+                flags=socket.AI_ADDRCONFIG,
+            )
+            fetch = executor.submit(
+                lambda: request.urlopen("http://ifconfig.me/ip", timeout=5).read().decode("utf8")
+            )
+            return resolve.result()[0][4][0], fetch.result().strip()
+
     @staticmethod
     def _validate_domain(domain: str | None) -> Union[NoReturn, Tuple[str, str]]:
         """
@@ -547,11 +741,12 @@ class Scaffold:
             domain = input("> 解析到本机的域名：")
 
         try:
-            server_ip = socket.getaddrinfo(domain, None)[-1][4][0]
+            server_ip, my_ip = Scaffold._lookup_domain(domain)
         except socket.gaierror:
             logging.error(f"域名不可达或拼写错误的域名 - domain={domain}")
+        except OSError as err:
+            logging.error(f"无法获取主机外网IP - url=http://ifconfig.me/ip err={err}")
         else:
-            my_ip = request.urlopen("http://ifconfig.me/ip").read().decode("utf8")
             if my_ip != server_ip:
                 logging.error(
                     f"你的主机外网IP与域名解析到的IP不一致 - my_ip={my_ip} domain={domain} server_ip={server_ip}"
@@ -574,7 +769,7 @@ class Scaffold:
             sys.exit()
 
         # UDP port already in use
-        if Project.is_port_in_used(port, proto="udp"):
+        if port in Project.bound_udp_ports() or Project.is_port_in_used(port, proto="udp"):
             logging.error(f"UDP 端口已被占用 - port={port}")
             sys.exit()
 
@@ -583,19 +778,24 @@ class Scaffold:
         return port
 
     @staticmethod
-    def _recv_stream(script: str, pipe: Literal["stdout", "stderr"] = "stdout") -> str:
-        p = subprocess.Popen(
-            script.split(),
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            universal_newlines=True,
-            text=True,
-        )
-        if pipe == "stdout":
-            return p.stdout.read().strip()
-        if pipe == "stderr":
-            return p.stderr.read().strip()
+    def _recv_stream(
+        script: str, pipe: Literal["stdout", "stderr"] = "stdout", timeout: float = 30
+    ) -> str:
+        try:
+            result = subprocess.run(
+                script.split(),
+                stdin=subprocess.DEVNULL,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+            )
+            output = getattr(result, pipe)
+        except subprocess.TimeoutExpired as err:
+            # Return whatever was captured before the deadline, e.g. `journalctl -f`
+            output = getattr(err, pipe) or ""
+            if isinstance(output, bytes):
+                output = output.decode("utf8", errors="ignore")
+        return output.strip()
 
     @staticmethod
     def install(params: argparse.Namespace):
@@ -606,33 +806,61 @@ class Scaffold:
 
         # 初始化证书对象
         cert = Certificate(domain)
-
-        # 为绑定到本机的域名申请证书
-        if not Path(cert.fullchain).exists():
-            CertBot(domain).run()
-        else:
-            logging.info(f"证书文件已存在 - path={Path(cert.fullchain).parent}")
-
-        # 初始化 workstation
-        project = Project()
-        user = User.gen()
+        should_request_cert = not Path(cert.fullchain).exists()
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            # 需要申请证书时，在后台预装 certbot
+            if should_request_cert:
+                executor.submit(CertBot.install_dependencies)
+
+            # 初始化 workstation
+            fresh_workstation = not Project.workstation.exists()
+            project = Project()
+            user = User.gen()
+
+            # 绑定传入的端口，或随机选用未被占用的 UDP 端口
+            project.server_port = port or project.server_port
+            server_port = project.server_port
+            project.server_ip = server_ip
+
+            # 证书申请成功前不写入系统服务配置
+            service = Service(path=project.service)
+
+            # 证书申请与 juicity-server 下载互不依赖，并行执行
+            tasks = {}
+            if should_request_cert:
+                task = CertBot(domain).run
+                tasks[executor.submit(task)] = task
+            else:
+                logging.info(f"证书文件已存在 - path={Path(cert.fullchain).parent}")
+
+            logging.info(f"正在下载 juicity-server")
+            task = partial(service.download_server, project.workstation)
+            tasks[executor.submit(task)] = task
+
+            wait(tasks, return_when=ALL_COMPLETED)
+            try:
+                for future, task in tasks.items():
+                    # 并行任务异常时回退到顺序执行，SystemExit 等中断信号直接抛出
+                    if isinstance(future.exception(), Exception):
+                        logging.warning(f"并行任务执行失败，转为顺序执行 - err={future.exception()}")
+                        task()
+                    else:
+                        future.result()
+            except BaseException:
+                # 证书申请失败时移除本次新建的工作空间，避免残留已下载的 juicity-server
+                if fresh_workstation:
+                    shutil.rmtree(project.workstation, ignore_errors=True)
+                raise
 
         # 设置脚本别名
         project.set_alias()
 
-        # 绑定传入的端口，或随机选用未被占用的 UDP 端口
-        project.server_port = port or project.server_port
-        server_port = project.server_port
-
         # 初始化系统服务配置
-        project.server_ip = server_ip
         service = Service.build_from_template(
             path=project.service, template=project.systemd_template
         )
 
-        logging.info(f"正在下载 juicity-server")
-        service.download_server(project.workstation)
-
         logging.info("正在生成默认的服务端配置")
         server_config = ServerConfig.from_automation(
             user, cert.fullchain, cert.privkey, server_port
@@ -669,7 +897,7 @@ class Scaffold:
 
         # 关停进程，注销系统服务，移除工作空间
         service = Service.build_from_template(project.service)
-        service.remove(project.workstation)
+        service.remove(project)
 
         project.reset_shell()
 
@@ -684,11 +912,10 @@ class Scaffold:
         service = Service.build_from_template(path=project.service)
 
         if cmd == "status":
-            active = Scaffold._recv_stream(f"systemctl is-active {service.name}")
+            active, ct_active = service.active_states(service.name, "certbot.timer")
             logging.info(f"juicity 服务状态：{active}")
             version = Scaffold._recv_stream(f"{project.executable} -v")
             logging.info(f"juicity 服务版本：{version}")
-            ct_active = Scaffold._recv_stream("systemctl is-active certbot.timer")
             logging.info(f"证书续订服务状态：{ct_active}")
             logging.info(f"服務端配置：{project.server_config}")
             logging.info(f"客戶端配置[NekoRay]：{project.client_nekoray_config}")